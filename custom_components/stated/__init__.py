@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import logging
+import re
+import sys
+from collections.abc import Callable, Iterable, Mapping
 from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import voluptuous as vol
@@ -19,18 +26,16 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import collection
 from homeassistant.helpers.collection import IDManager
 from homeassistant.helpers.entity_component import EntityComponent
-from homeassistant.helpers.event import async_track_point_in_time
-from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.helpers.config_validation as cv
-import homeassistant.util.dt as dt_util
 from homeassistant.util import slugify
 
 from .const import (
     CONF_ATTRIBUTES,
     CONF_EXPIRE_ACTION,
     CONF_EXPIRE_TO,
+    CONF_ITEMS,
     CONF_PREFIX,
     CONF_TTL,
     CONF_VALUE,
@@ -47,29 +52,185 @@ from .const import (
     TYPE_NUMBER,
     TYPE_STRING,
 )
+from .ttl import TtlScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+_ENTITY_PREFIX = f"{DOMAIN}."
+
+
+def _positive_int(value: Any) -> int:
+    """Validate a TTL: coerce to int and require at least 1."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid("expected an integer") from err
+    if number < 1:
+        raise vol.Invalid("value must be at least 1")
+    return number
+
+
+_NAME_VALIDATOR = vol.All(str, vol.Length(min=1))
+_VALUE_VALIDATOR = vol.Any(str, int, float, bool, None)
+_TYPE_VALIDATOR = vol.In(frozenset((TYPE_BOOLEAN, TYPE_NUMBER, TYPE_STRING)))
+_EXPIRE_ACTION_VALIDATOR = vol.In(
+    frozenset((EXPIRE_ACTION_RESET, EXPIRE_ACTION_DELETE))
+)
+
 STORAGE_FIELDS = {
-    vol.Required(CONF_NAME): vol.All(str, vol.Length(min=1)),
-    vol.Optional(CONF_VALUE, default=""): vol.Any(str, int, float, bool, None),
-    vol.Optional(CONF_VAR_TYPE, default=DEFAULT_TYPE): vol.In(
-        [TYPE_BOOLEAN, TYPE_NUMBER, TYPE_STRING]
-    ),
+    vol.Required(CONF_NAME): _NAME_VALIDATOR,
+    vol.Optional(CONF_VALUE, default=""): _VALUE_VALIDATOR,
+    vol.Optional(CONF_VAR_TYPE, default=DEFAULT_TYPE): _TYPE_VALIDATOR,
     vol.Optional(CONF_ICON): cv.icon,
     vol.Optional(CONF_ATTRIBUTES, default={}): dict,
 }
 
 SET_VALUE_SCHEMA = {
-    vol.Required(CONF_VALUE): vol.Any(str, int, float, bool, None),
-    vol.Optional(CONF_TTL): vol.All(vol.Coerce(int), vol.Range(min=1)),
-    vol.Optional(CONF_EXPIRE_TO): vol.Any(str, int, float, bool, None),
-    vol.Optional(CONF_EXPIRE_ACTION, default=DEFAULT_EXPIRE_ACTION): vol.In(
-        [EXPIRE_ACTION_RESET, EXPIRE_ACTION_DELETE]
-    ),
+    vol.Required(CONF_VALUE): _VALUE_VALIDATOR,
+    vol.Optional(CONF_TTL): _positive_int,
+    vol.Optional(CONF_EXPIRE_TO): _VALUE_VALIDATOR,
+    vol.Optional(
+        CONF_EXPIRE_ACTION, default=DEFAULT_EXPIRE_ACTION
+    ): _EXPIRE_ACTION_VALIDATOR,
     vol.Optional(CONF_ATTRIBUTES): dict,
 }
 
+# Compiled once at import; the websocket API and entity service registration
+# still take the raw field dicts above.
+STORAGE_SCHEMA = vol.Schema(STORAGE_FIELDS)
+
+SET_SCHEMA = vol.Schema(
+    {
+        **STORAGE_FIELDS,
+        vol.Optional(CONF_TTL): _positive_int,
+        vol.Optional(CONF_EXPIRE_TO): _VALUE_VALIDATOR,
+        vol.Optional(
+            CONF_EXPIRE_ACTION, default=DEFAULT_EXPIRE_ACTION
+        ): _EXPIRE_ACTION_VALIDATOR,
+    }
+)
+
+BULK_SET_SCHEMA = vol.Schema(
+    {vol.Required(CONF_ITEMS): vol.All(cv.ensure_list, [SET_SCHEMA])}
+)
+
+DELETE_SCHEMA = vol.Schema({vol.Required(CONF_NAME): _NAME_VALIDATOR})
+
+DELETE_PREFIX_SCHEMA = vol.Schema({vol.Required(CONF_PREFIX): _NAME_VALIDATOR})
+
+# Variable names are few and long-lived, so repeat slugs are near-free.
+_slugify = lru_cache(maxsize=2048)(slugify)
+
+_TRUE_STRINGS = frozenset({"on", "true", "1", "yes"})
+_EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+# Re-applying an identical TTL that would move expiry by less than this is
+# treated as a no-op instead of rescheduling and rewriting state.
+_TTL_RETRIGGER_SLACK = timedelta(seconds=1)
+_NUMERIC_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+def _parse_number(value: Any) -> int | float:
+    """Parse a number without raising; unparseable input becomes 0."""
+    if isinstance(value, (int, float)):
+        return value
+    if not isinstance(value, str):
+        return 0
+    value = value.strip()
+    if _NUMERIC_RE.fullmatch(value) is None:
+        return 0
+    if "." in value or "e" in value or "E" in value:
+        return float(value)
+    try:
+        return int(value)
+    except ValueError:
+        # Past the int string-conversion digit limit; float saturates to inf
+        return float(value)
+
+
+def _coerce_boolean(value: Any) -> bool | None:
+    """Coerce value for a boolean variable."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value in _TRUE_STRINGS or value.lower() in _TRUE_STRINGS
+    return bool(value)
+
+
+def _coerce_number(value: Any) -> int | float | None:
+    """Coerce value for a number variable."""
+    if value is None:
+        return None
+    return _parse_number(value)
+
+
+def _coerce_string(value: Any) -> str | None:
+    """Coerce value for a string variable."""
+    if value is None:
+        return None
+    return str(value)
+
+
+def _memoize_coercer(coerce: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a coercer with an LRU cache for string input."""
+    # Only strings need parsing; other types are cheap to coerce, and keying
+    # them on == would conflate values such as 0.0 and -0.0.
+    cached = lru_cache(maxsize=512)(coerce)
+
+    def coerce_value(value: Any) -> Any:
+        """Coerce value, through the cache when it is a string."""
+        if type(value) is str:
+            return cached(value)
+        return coerce(value)
+
+    return coerce_value
+
+
+_COERCE_FNS = {
+    TYPE_BOOLEAN: _memoize_coercer(_coerce_boolean),
+    TYPE_NUMBER: _memoize_coercer(_coerce_number),
+    TYPE_STRING: _memoize_coercer(_coerce_string),
+}
+
+
+@lru_cache(maxsize=32)
+def _ttl_delta(seconds: int) -> timedelta:
+    """Return a timedelta for a TTL; automations reuse a handful of values."""
+    return timedelta(seconds=seconds)
+
+
+def _attributes_view(attributes: Mapping[str, Any] | None) -> Mapping[str, Any]:
+    """Return a read-only view of attributes, sharing one empty view."""
+    return MappingProxyType(attributes) if attributes else _EMPTY_ATTRIBUTES
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Return True if two coerced values would produce the same state."""
+    return type(old) is type(new) and old == new
+
+
+def _boolean_state(value: Any) -> str:
+    """Format a boolean value as entity state."""
+    return STATE_ON if value else STATE_OFF
+
+
+def _number_state(value: Any) -> str | None:
+    """Format a number value as entity state."""
+    return None if value is None else str(value)
+
+
+def _string_state(value: Any) -> str | None:
+    """Format a string value as entity state."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+_STATE_FNS = {
+    TYPE_BOOLEAN: _boolean_state,
+    TYPE_NUMBER: _number_state,
+    TYPE_STRING: _string_state,
+}
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Stated domain."""
@@ -87,6 +248,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         id_manager,
     )
 
+    # Populated before loading so entities find the scheduler when added
+    hass.data[DOMAIN] = {
+        "component": component,
+        "collection": storage_collection,
+        "ttl": TtlScheduler(hass),
+    }
+
     collection.sync_entity_lifecycle(
         hass, DOMAIN, DOMAIN, component, storage_collection, Variable
     )
@@ -97,68 +265,98 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         storage_collection, DOMAIN, DOMAIN, STORAGE_FIELDS, STORAGE_FIELDS
     ).async_setup(hass)
 
-    _register_services(hass, storage_collection)
+    _register_services(hass, storage_collection, component)
 
     component.async_register_entity_service(
         "set_value", SET_VALUE_SCHEMA, "async_set_value"
     )
     component.async_register_entity_service("toggle", None, "async_toggle")
 
-    hass.data[DOMAIN] = {
-        "component": component,
-        "collection": storage_collection,
-    }
-
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    hass.data.pop(DOMAIN, None)
+    if (data := hass.data.pop(DOMAIN, None)) is not None:
+        data["ttl"].async_shutdown()
     return True
 
 
 def _register_services(
-    hass: HomeAssistant, storage_collection: VariableStorageCollection
+    hass: HomeAssistant,
+    storage_collection: VariableStorageCollection,
+    component: EntityComponent[Variable],
 ) -> None:
-    """Register stated.set, stated.delete, and stated.delete_prefix services."""
-
-    async def async_handle_set(call: ServiceCall) -> None:
-        """Handle stated.set — upsert a variable."""
-        name = call.data[CONF_NAME]
-        slug = slugify(name)
+    """Register the stated.set, bulk_set, delete, and delete_prefix services."""
 
+    def _create_data(data: Mapping[str, Any]) -> dict[str, Any]:
+        """Return the storage fields of a stated.set payload."""
+        # SET_SCHEMA has already filled in value, var_type and attributes
         create_data = {
-            CONF_NAME: name,
-            CONF_VALUE: call.data.get(CONF_VALUE, ""),
-            CONF_VAR_TYPE: call.data.get(CONF_VAR_TYPE, DEFAULT_TYPE),
+            CONF_NAME: data[CONF_NAME],
+            CONF_VALUE: data[CONF_VALUE],
+            CONF_VAR_TYPE: data[CONF_VAR_TYPE],
+            CONF_ATTRIBUTES: data[CONF_ATTRIBUTES],
         }
-        if CONF_ICON in call.data:
-            create_data[CONF_ICON] = call.data[CONF_ICON]
-        if CONF_ATTRIBUTES in call.data:
-            create_data[CONF_ATTRIBUTES] = call.data[CONF_ATTRIBUTES]
+        if CONF_ICON in data:
+            create_data[CONF_ICON] = data[CONF_ICON]
+        return create_data
 
-        ttl = call.data.get(CONF_TTL)
-        expire_to = call.data.get(CONF_EXPIRE_TO)
-        expire_action = call.data.get(CONF_EXPIRE_ACTION, DEFAULT_EXPIRE_ACTION)
+    @callback
+    def _apply_ttl(slug: str, data: Mapping[str, Any]) -> None:
+        """Apply the TTL of a stated.set payload once the entity exists."""
+        ttl = data.get(CONF_TTL)
+        if ttl is None:
+            return
+        entity = component.get_entity(_ENTITY_PREFIX + slug)
+        if entity is not None:
+            entity.apply_ttl(
+                ttl,
+                data.get(CONF_EXPIRE_TO),
+                data[CONF_EXPIRE_ACTION],
+            )
 
+    async def _async_upsert(slug: str, create_data: dict[str, Any]) -> None:
+        """Create the variable, or update it if it already exists."""
         if slug in storage_collection.data:
             await storage_collection.async_update_item(slug, create_data)
         else:
             await storage_collection.async_create_item(create_data)
 
+    async def _async_set(data: Mapping[str, Any]) -> None:
+        """Upsert a single variable from a stated.set payload."""
+        slug = _slugify(data[CONF_NAME])
+        await _async_upsert(slug, _create_data(data))
+
         # Apply TTL after entity exists
-        if ttl is not None:
-            entity_id = f"{DOMAIN}.{slug}"
-            comp = hass.data[DOMAIN]["component"]
-            entity = comp.get_entity(entity_id)
-            if entity is not None:
-                entity.apply_ttl(ttl, expire_to, expire_action)
+        _apply_ttl(slug, data)
+
+    async def async_handle_set(call: ServiceCall) -> None:
+        """Handle stated.set — upsert a variable."""
+        await _async_set(call.data)
+
+    async def async_handle_bulk_set(call: ServiceCall) -> None:
+        """Handle stated.bulk_set — upsert several variables in one pass."""
+        items = call.data[CONF_ITEMS]
+        if len(items) == 1:
+            await _async_set(items[0])
+            return
+
+        # Last item wins when a name repeats, for storage and TTL alike
+        by_slug = {_slugify(item[CONF_NAME]): item for item in items}
+        await asyncio.gather(
+            *(
+                _async_upsert(slug, _create_data(item))
+                for slug, item in by_slug.items()
+            )
+        )
+        for slug, item in by_slug.items():
+            _apply_ttl(slug, item)
 
     async def async_handle_delete(call: ServiceCall) -> None:
         """Handle stated.delete — remove a variable."""
         name = call.data[CONF_NAME]
-        slug = slugify(name)
+        slug = _slugify(name)
 
         if slug not in storage_collection.data:
             _LOGGER.warning("Cannot delete '%s': variable does not exist", name)
@@ -168,113 +366,128 @@ def _register_services(
 
     async def async_handle_delete_prefix(call: ServiceCall) -> None:
         """Handle stated.delete_prefix — remove all variables matching a prefix."""
-        prefix = slugify(call.data[CONF_PREFIX])
+        prefix = _slugify(call.data[CONF_PREFIX])
         if not prefix:
             _LOGGER.warning("Cannot delete_prefix: empty prefix")
             return
 
-        # Collect matching IDs first (can't mutate dict during iteration)
-        to_delete = [
-            item_id
-            for item_id in storage_collection.data
-            if item_id.startswith(prefix)
-        ]
+        to_delete = storage_collection.async_ids_with_prefix(prefix)
 
         if not to_delete:
             _LOGGER.debug("No variables match prefix '%s'", prefix)
             return
 
-        for item_id in to_delete:
-            await storage_collection.async_delete_item(item_id)
+        await storage_collection.async_delete_items(to_delete)
 
         _LOGGER.info(
             "Deleted %d variable(s) matching prefix '%s'", len(to_delete), prefix
         )
 
+    hass.services.async_register(DOMAIN, "set", async_handle_set, schema=SET_SCHEMA)
+
     hass.services.async_register(
-        DOMAIN,
-        "set",
-        async_handle_set,
-        schema=vol.Schema(
-            {
-                vol.Required(CONF_NAME): vol.All(str, vol.Length(min=1)),
-                vol.Optional(CONF_VALUE, default=""): vol.Any(
-                    str, int, float, bool, None
-                ),
-                vol.Optional(CONF_VAR_TYPE, default=DEFAULT_TYPE): vol.In(
-                    [TYPE_BOOLEAN, TYPE_NUMBER, TYPE_STRING]
-                ),
-                vol.Optional(CONF_ICON): cv.icon,
-                vol.Optional(CONF_ATTRIBUTES, default={}): dict,
-                vol.Optional(CONF_TTL): vol.All(vol.Coerce(int), vol.Range(min=1)),
-                vol.Optional(CONF_EXPIRE_TO): vol.Any(
-                    str, int, float, bool, None
-                ),
-                vol.Optional(
-                    CONF_EXPIRE_ACTION, default=DEFAULT_EXPIRE_ACTION
-                ): vol.In([EXPIRE_ACTION_RESET, EXPIRE_ACTION_DELETE]),
-            }
-        ),
+        DOMAIN, "bulk_set", async_handle_bulk_set, schema=BULK_SET_SCHEMA
     )
 
     hass.services.async_register(
-        DOMAIN,
-        "delete",
-        async_handle_delete,
-        schema=vol.Schema(
-            {
-                vol.Required(CONF_NAME): vol.All(str, vol.Length(min=1)),
-            }
-        ),
+        DOMAIN, "delete", async_handle_delete, schema=DELETE_SCHEMA
     )
 
     hass.services.async_register(
         DOMAIN,
         "delete_prefix",
         async_handle_delete_prefix,
-        schema=vol.Schema(
-            {
-                vol.Required(CONF_PREFIX): vol.All(str, vol.Length(min=1)),
-            }
-        ),
+        schema=DELETE_PREFIX_SCHEMA,
     )
 
 
 class VariableStorageCollection(collection.DictStorageCollection):
     """Storage collection for runtime variables."""
 
-    CREATE_UPDATE_SCHEMA = vol.Schema(
-        {
-            vol.Required(CONF_NAME): vol.All(str, vol.Length(min=1)),
-            vol.Optional(CONF_VALUE, default=""): vol.Any(
-                str, int, float, bool, None
-            ),
-            vol.Optional(CONF_VAR_TYPE, default=DEFAULT_TYPE): vol.In(
-                [TYPE_BOOLEAN, TYPE_NUMBER, TYPE_STRING]
-            ),
-            vol.Optional(CONF_ICON): cv.icon,
-            vol.Optional(CONF_ATTRIBUTES, default={}): dict,
-        }
-    )
+    CREATE_UPDATE_SCHEMA = STORAGE_SCHEMA
+
+    def __init__(self, store: Store, id_manager: IDManager | None = None) -> None:
+        """Initialize the collection and its sorted ID index."""
+        super().__init__(store, id_manager)
+        self._sorted_ids: list[str] = []
+        self.async_add_change_set_listener(self._async_index_changes)
+
+    async def _async_index_changes(
+        self, change_set: Iterable[collection.CollectionChange]
+    ) -> None:
+        """Keep the sorted ID index in step with the collection."""
+        for change in change_set:
+            if change.change_type == collection.CHANGE_ADDED:
+                bisect.insort(self._sorted_ids, change.item_id)
+            elif change.change_type == collection.CHANGE_REMOVED:
+                index = bisect.bisect_left(self._sorted_ids, change.item_id)
+                if self._sorted_ids[index : index + 1] == [change.item_id]:
+                    del self._sorted_ids[index]
+
+    @callback
+    def async_ids_with_prefix(self, prefix: str) -> list[str]:
+        """Return the IDs starting with prefix, in sorted order."""
+        ids = self._sorted_ids
+        lo = bisect.bisect_left(ids, prefix)
+        hi = bisect.bisect_left(ids, prefix + "\uffff", lo)
+        return ids[lo:hi]
 
     async def _process_create_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Validate and transform creation data."""
         return self.CREATE_UPDATE_SCHEMA(data)
 
+    async def async_delete_items(self, item_ids: Iterable[str]) -> None:
+        """Delete several items with one save and one change notification."""
+        changes = [
+            collection.CollectionChange(
+                collection.CHANGE_REMOVED, item_id, self.data.pop(item_id)
+            )
+            for item_id in item_ids
+            if item_id in self.data
+        ]
+        if not changes:
+            return
+        self._async_schedule_save()
+        await self.notify_changes(changes)
+
     @callback
     def _get_suggested_id(self, info: dict[str, Any]) -> str:
         """Suggest an ID based on the name."""
-        return slugify(info[CONF_NAME])
+        return _slugify(info[CONF_NAME])
 
     async def _update_data(
         self, item: dict[str, Any], update_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Return updated data."""
-        return {**item, **self.CREATE_UPDATE_SCHEMA(update_data)}
-
-
-class Variable(collection.CollectionEntity, RestoreEntity):
-    """A runtime variable entity."""
+        return item | self.CREATE_UPDATE_SCHEMA(update_data)
+
+
+class Variable(collection.CollectionEntity):
+    """A runtime variable entity.
+
+    The value is persisted and reloaded by the DictStorageCollection, so the
+    entity deliberately does not restore from the recorder. Doing so would
+    race with stated.set: a freshly created variable could be overwritten by
+    an older recorded state (e.g. an expired "off") right after the call.
+    """
+
+    # The Entity base class keeps a __dict__, so this only moves our own
+    # per-variable fields onto slot descriptors.
+    __slots__ = (
+        "_attributes",
+        "_attrs_cache",
+        "_coerce_fn",
+        "_config",
+        "_expire_action",
+        "_expire_to",
+        "_expires_at",
+        "_last_ttl_args",
+        "_state_fn",
+        "_ttl_scheduler",
+        "_ttl_unsub",
+        "_value",
+        "_var_type",
+    )
 
     _attr_should_poll = False
     editable: bool = True
@@ -282,13 +495,17 @@ class Variable(collection.CollectionEntity, RestoreEntity):
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize a variable."""
         self._config = config
-        self._var_type: str = config.get(CONF_VAR_TYPE, DEFAULT_TYPE)
+        self._set_var_type(config.get(CONF_VAR_TYPE, DEFAULT_TYPE))
         self._value = self._coerce(config.get(CONF_VALUE, ""))
-        self._attributes: dict[str, Any] = dict(config.get(CONF_ATTRIBUTES, {}))
+        # Read-only view of the stored attributes; copied only on write
+        self._attributes = _attributes_view(config.get(CONF_ATTRIBUTES))
+        self._ttl_scheduler: TtlScheduler | None = None
         self._ttl_unsub: callback | None = None
         self._expires_at = None
         self._expire_to = None
         self._expire_action: str = DEFAULT_EXPIRE_ACTION
+        self._last_ttl_args: tuple[int, type, Any, str] | None = None
+        self._attrs_cache: dict[str, Any] | None = None
 
     @classmethod
     def from_storage(cls, config: dict[str, Any]) -> Variable:
@@ -318,47 +535,34 @@ class Variable(collection.CollectionEntity, RestoreEntity):
     @property
     def state(self) -> str | None:
         """Return the state."""
-        if self._var_type == TYPE_BOOLEAN:
-            return STATE_ON if self._value else STATE_OFF
-        if self._value is None:
-            return None
-        return str(self._value)
+        return self._state_fn(self._value)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs = {**self._attributes, "var_type": self._var_type}
-        if self._expires_at is not None:
-            attrs["expires_at"] = self._expires_at.isoformat()
-        return attrs
+        if self._attrs_cache is None:
+            attrs = {**self._attributes, "var_type": self._var_type}
+            if self._expires_at is not None:
+                attrs["expires_at"] = self._expires_at.isoformat()
+            self._attrs_cache = attrs
+        return self._attrs_cache
 
     def _coerce(self, value: Any) -> Any:
         """Coerce value to the variable's type."""
-        if value is None:
-            return None
-
-        if self._var_type == TYPE_BOOLEAN:
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                return value.lower() in ("on", "true", "1", "yes")
-            return bool(value)
-
-        if self._var_type == TYPE_NUMBER:
-            if isinstance(value, (int, float)):
-                return value
-            try:
-                if isinstance(value, str) and "." in value:
-                    return float(value)
-                return int(value)
-            except (ValueError, TypeError):
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return 0
-
-        # String type
-        return str(value) if value is not None else ""
+        # Values already stored in their own type need no work or cache lookup
+        value_type = type(value)
+        if (value_type is str and self._var_type == TYPE_STRING) or (
+            value_type is bool and self._var_type == TYPE_BOOLEAN
+        ):
+            return value
+        return self._coerce_fn(value)
+
+    def _set_var_type(self, var_type: str) -> None:
+        """Set the variable type and pick its state and coerce functions."""
+        # Interned so the hot var_type comparisons hit the identity fast path
+        self._var_type = sys.intern(var_type)
+        self._state_fn = _STATE_FNS.get(var_type, _string_state)
+        self._coerce_fn = _COERCE_FNS.get(var_type, _COERCE_FNS[TYPE_STRING])
 
     def _get_default_expire_value(self) -> Any:
         """Return the default expiry value for the current type."""
@@ -370,8 +574,10 @@ class Variable(collection.CollectionEntity, RestoreEntity):
 
     def _fire_value_changed(self, old_value: Any, new_value: Any) -> None:
         """Fire stated.value_changed event if value actually changed."""
-        old_state = self._format_state(old_value)
-        new_state = self._format_state(new_value)
+        if _same_value(old_value, new_value):
+            return
+        old_state = self._state_fn(old_value)
+        new_state = self._state_fn(new_value)
         if old_state == new_state:
             return
         self.hass.bus.async_fire(
@@ -385,14 +591,6 @@ class Variable(collection.CollectionEntity, RestoreEntity):
             },
         )
 
-    def _format_state(self, value: Any) -> str | None:
-        """Format a value as it would appear in entity state."""
-        if self._var_type == TYPE_BOOLEAN:
-            return STATE_ON if value else STATE_OFF
-        if value is None:
-            return None
-        return str(value)
-
     @callback
     def apply_ttl(
         self,
@@ -401,25 +599,57 @@ class Variable(collection.CollectionEntity, RestoreEntity):
         expire_action: str = DEFAULT_EXPIRE_ACTION,
     ) -> None:
         """Apply TTL to this variable."""
+        if self._apply_ttl_no_write(ttl, expire_to, expire_action):
+            self.async_write_ha_state()
+
+    @callback
+    def _apply_ttl_no_write(
+        self,
+        ttl: int,
+        expire_to: Any = None,
+        expire_action: str = DEFAULT_EXPIRE_ACTION,
+    ) -> bool:
+        """Schedule the TTL without writing state.
+
+        Returns False if the running TTL already matched and was left alone.
+        """
+        if self._is_ttl_retrigger(ttl, expire_to, expire_action):
+            return False
+
         # Cancel existing TTL
         if self._ttl_unsub is not None:
             self._ttl_unsub()
             self._ttl_unsub = None
             self._expires_at = None
 
-        self._expire_action = expire_action
+        self._expire_action = sys.intern(expire_action)
 
         if expire_to is not None:
             self._expire_to = self._coerce(expire_to)
         else:
             self._expire_to = self._get_default_expire_value()
 
-        expire_at = dt_util.utcnow() + timedelta(seconds=ttl)
+        scheduler = self._ttl_scheduler
+        expire_at = scheduler.async_now() + _ttl_delta(ttl)
         self._expires_at = expire_at
-        self._ttl_unsub = async_track_point_in_time(
-            self.hass, self._ttl_expired, expire_at
+        self._attrs_cache = None
+        self._ttl_unsub = scheduler.async_schedule(expire_at, self._ttl_expired)
+        # The type is kept so that 1, 1.0 and True are distinct re-triggers
+        self._last_ttl_args = (ttl, type(expire_to), expire_to, expire_action)
+        return True
+
+    @callback
+    def _is_ttl_retrigger(self, ttl: int, expire_to: Any, expire_action: str) -> bool:
+        """Return True if the running TTL already matches these arguments."""
+        return (
+            self._ttl_unsub is not None
+            and self._last_ttl_args
+            == (ttl, type(expire_to), expire_to, expire_action)
+            and self._ttl_scheduler.async_now()
+            + _ttl_delta(ttl)
+            - self._expires_at
+            < _TTL_RETRIGGER_SLACK
         )
-        self.async_write_ha_state()
 
     @callback
     def _cancel_ttl(self) -> None:
@@ -428,6 +658,7 @@ class Variable(collection.CollectionEntity, RestoreEntity):
             self._ttl_unsub()
             self._ttl_unsub = None
             self._expires_at = None
+            self._attrs_cache = None
             self._expire_to = None
             self._expire_action = DEFAULT_EXPIRE_ACTION
 
@@ -435,6 +666,7 @@ class Variable(collection.CollectionEntity, RestoreEntity):
         """Handle TTL expiry."""
         self._ttl_unsub = None
         self._expires_at = None
+        self._attrs_cache = None
 
         if self._expire_action == EXPIRE_ACTION_DELETE:
             # Delete the variable entirely
@@ -449,15 +681,18 @@ class Variable(collection.CollectionEntity, RestoreEntity):
             return
 
         # Default: reset to expire_to value
-        old_value = self._value
-        self._value = (
+        new_value = (
             self._expire_to
             if self._expire_to is not None
             else self._get_default_expire_value()
         )
         self._expire_to = None
         self._expire_action = DEFAULT_EXPIRE_ACTION
-        self._fire_value_changed(old_value, self._value)
+        if not _same_value(self._value, new_value):
+            old_value = self._value
+            self._value = new_value
+            self._fire_value_changed(old_value, new_value)
+        # Still write when the value is unchanged so expires_at is cleared
         self.async_write_ha_state()
 
     async def async_set_value(
@@ -469,19 +704,34 @@ class Variable(collection.CollectionEntity, RestoreEntity):
         attributes: dict[str, Any] | None = None,
     ) -> None:
         """Set the value of this variable (entity service)."""
+        new_value = self._coerce(value)
+        if (
+            ttl is None
+            and attributes is None
+            and self._ttl_unsub is None
+            and _same_value(self._value, new_value)
+        ):
+            return
+
         old_value = self._value
-        self._value = self._coerce(value)
+        self._value = new_value
 
         if attributes is not None:
-            self._attributes.update(attributes)
+            self._attributes = MappingProxyType({**self._attributes, **attributes})
+            self._attrs_cache = None
 
         self._fire_value_changed(old_value, self._value)
 
-        if ttl is not None:
-            self.apply_ttl(ttl, expire_to, expire_action)
-        else:
+        if ttl is None:
             self._cancel_ttl()
-            self.async_write_ha_state()
+        elif (
+            not self._apply_ttl_no_write(ttl, expire_to, expire_action)
+            and attributes is None
+            and _same_value(old_value, new_value)
+        ):
+            # Identical re-trigger of the running TTL: nothing to write
+            return
+        self.async_write_ha_state()
 
     async def async_toggle(self) -> None:
         """Toggle a boolean variable."""
@@ -499,25 +749,27 @@ class Variable(collection.CollectionEntity, RestoreEntity):
 
     async def async_update_config(self, config: dict[str, Any]) -> None:
         """Handle updated config from the collection."""
+        if (
+            config == self._config
+            and _same_value(self._value, self._coerce(config.get(CONF_VALUE, "")))
+            and config.get(CONF_ATTRIBUTES, self._attributes) == self._attributes
+        ):
+            return
+
         old_value = self._value
         self._config = config
-        self._var_type = config.get(CONF_VAR_TYPE, DEFAULT_TYPE)
+        self._set_var_type(config.get(CONF_VAR_TYPE, DEFAULT_TYPE))
         self._value = self._coerce(config.get(CONF_VALUE, ""))
         if CONF_ATTRIBUTES in config:
-            self._attributes = dict(config[CONF_ATTRIBUTES])
+            self._attributes = _attributes_view(config[CONF_ATTRIBUTES])
+        self._attrs_cache = None
         self._fire_value_changed(old_value, self._value)
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Entity added to HA — value already loaded from storage collection."""
+        """Keep a reference to the shared TTL scheduler."""
         await super().async_added_to_hass()
-        # Intentionally skip recorder state restoration.
-        # The DictStorageCollection persists and reloads the config (including value)
-        # on HA restart, so RestoreEntity restoration is not needed.
-        # Restoring from the recorder would overwrite a freshly-set value from
-        # stated.set (e.g., when creating a new entity with value="on", the recorder
-        # might have the previous expired "off" state, causing a race condition in
-        # automations that check the state immediately after calling stated.set).
+        self._ttl_scheduler = self.hass.data[DOMAIN]["ttl"]
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up TTL on removal."""
@@ -11,6 +11,7 @@ CONF_TTL = "ttl"
 CONF_EXPIRE_TO = "expire_to"
 CONF_EXPIRE_ACTION = "expire_action"
 CONF_PREFIX = "prefix"
+CONF_ITEMS = "items"
 
 TYPE_BOOLEAN = "boolean"
 TYPE_NUMBER = "number"
@@ -0,0 +1,136 @@
+"""Shared TTL scheduling for Stated variables."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from itertools import count
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+ExpiryAction = Callable[[datetime], Coroutine[Any, Any, None]]
+
+# Rebuild the heap once cancelled entries outnumber live ones by this much,
+# so re-triggered TTLs don't pile up until their original expiry.
+_COMPACT_MIN_CANCELLED = 64
+
+
+class TtlScheduler:
+    """Drive every variable TTL from one timer over a min-heap of expiries.
+
+    Deadlines are kept in event-loop (monotonic) time, so expiries are not
+    shifted by wall-clock adjustments and the single timer is a plain
+    loop.call_at handle.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        # Entries are [deadline, seq, action]; cancelling clears the action
+        # in place and the entry is dropped when it reaches the top.
+        self._heap: list[list[Any]] = []
+        self._seq = count()
+        self._cancelled = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_at: float | None = None
+        self._now: datetime | None = None
+
+    @callback
+    def async_schedule(
+        self, expires_at: datetime, action: ExpiryAction
+    ) -> CALLBACK_TYPE:
+        """Run action at expires_at and return a callback that cancels it."""
+        deadline = (
+            self._hass.loop.time() + (expires_at - self.async_now()).total_seconds()
+        )
+        entry: list[Any] = [deadline, next(self._seq), action]
+        heapq.heappush(self._heap, entry)
+        if self._timer_at is None or deadline < self._timer_at:
+            self._async_arm(deadline)
+
+        @callback
+        def cancel() -> None:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._cancelled += 1
+            if (
+                self._cancelled > _COMPACT_MIN_CANCELLED
+                and self._cancelled * 2 > len(self._heap)
+            ):
+                self._async_compact()
+
+        return cancel
+
+    @callback
+    def async_now(self) -> datetime:
+        """Return the current UTC time, shared within one loop iteration.
+
+        A script that sets many variables with a TTL applies them all in the
+        same iteration; they share one utcnow() call and one base time.
+        """
+        if self._now is None:
+            self._now = dt_util.utcnow()
+            self._hass.loop.call_soon(self._async_clear_now)
+        return self._now
+
+    @callback
+    def _async_clear_now(self) -> None:
+        """Drop the cached time at the start of the next loop iteration."""
+        self._now = None
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the timer and drop all pending expiries."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_at = None
+        for entry in self._heap:
+            entry[2] = None
+        self._heap.clear()
+        self._cancelled = 0
+
+    @callback
+    def _async_arm(self, deadline: float) -> None:
+        """Point the single timer at deadline (loop time)."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_at = deadline
+        self._timer = self._hass.loop.call_at(deadline, self._async_fire)
+
+    @callback
+    def _async_compact(self) -> None:
+        """Drop cancelled entries from the heap."""
+        # In place: _async_fire may be iterating this same list when an
+        # expiry cancels another TTL and triggers a compaction.
+        self._heap[:] = [entry for entry in self._heap if entry[2] is not None]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run every expiry that is due and re-arm for the next one."""
+        self._timer = None
+        self._timer_at = None
+        heap = self._heap
+        loop_now = self._hass.loop.time()
+        now = self.async_now()
+
+        while heap and (heap[0][2] is None or heap[0][0] <= loop_now):
+            entry = heapq.heappop(heap)
+            action = entry[2]
+            if action is None:
+                if self._cancelled:
+                    self._cancelled -= 1
+                continue
+            # Tombstone it so a late cancel() doesn't count a popped entry
+            entry[2] = None
+            self._hass.async_create_task(action(now))
+
+        if heap:
+            self._async_arm(heap[0][0])